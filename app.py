@@ -8,7 +8,13 @@ st.set_page_config(page_title="Meetly", page_icon="👋", layout="wide")
 
 # Initialize the database (create tables if they don't exist).
 # This ensures that 'users' and 'saved_events' tables exist before the app tries to access them. 
-database.init_db()
+# st.cache_resource makes this run only once per server process instead of on every rerun.
+@st.cache_resource
+def _init_once():
+    database.init_db()
+    return True
+
+_init_once()
 
 # --- SESSION STATE INITIALIZATION ---
 # Session state is crucial in Streamlit persisting data across user interactions
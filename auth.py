@@ -1,7 +1,11 @@
 import streamlit as st
 import os
+import json
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, Resource
 
 # Allow OAuth over HTTP (necessary for localhost testing).
 os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
@@ -19,6 +23,44 @@ if env_status == "production":
 else:
     REDIRECT_URI = "http://localhost:8501"
 
+@dataclass(slots=True)
+class AuthState:
+    """
+    Result of the login check: exactly one of the fields is set, or neither on failure.
+    url: the Google login URL (user still has to connect)
+    service: the Google Calendar API service object (user is logged in)
+    """
+    url: Optional[str] = None
+    service: Optional[Resource] = None
+
+def credentials_key(credentials):
+    """
+    Returns a non-secret fingerprint of the given Google credentials.
+    Used as cache key so cached data of different Google logins is kept apart.
+    """
+    token = getattr(credentials, "refresh_token", None) or getattr(credentials, "token", None) or ""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _build_service(credentials):
+    """
+    Builds the Google Calendar API service object once per session and set of credentials.
+    The client is kept in st.session_state next to the credentials instead of a process-wide
+    cache: its HTTP transport is not thread-safe, and every browser session runs in its own thread.
+    """
+    if st.session_state.get("service_credentials") is not credentials:
+        st.session_state.service = build("calendar", "v3", credentials=credentials)
+        st.session_state.service_credentials = credentials
+    return st.session_state.service
+
+@st.cache_data(show_spinner=False)
+def _client_config_from_file(path, mtime):
+    """
+    Returns the OAuth client configuration from a client secrets JSON file.
+    Cached per file and modification time, so the file is only read again when it changes.
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
 def get_google_service():
     """
     Handles the entire OAuth2 login flow for Google Calendar API access.
@@ -28,8 +70,8 @@ def get_google_service():
     3. Process the authorization code upon callback or generate the login URL.
 
     Returns:
-        object/str/None: The Google Calendar API service object (if logged in), the authorization URL
-        (if login is required), or None (on failure)
+        AuthState: with 'service' set (if logged in), with 'url' set to the authorization URL
+        (if login is required), or with neither set (on failure)
     """
     # 1. Check Session State
     # If the user is already logged in during this session, we don't need to authenticate again.
@@ -40,8 +82,8 @@ def get_google_service():
 
     # If valid credentials exist, build and return the API service immediately.
     if st.session_state.credentials:
-        # Build and return the high-level API service object using the acquired credentials. 
-        return build("calendar", "v3", credentials=st.session_state.credentials)
+        # Build (or reuse this session's) high-level API service object using the acquired credentials. 
+        return AuthState(service=_build_service(st.session_state.credentials))
 
     # 2. Initialize Login Flow (Configuration Loading)
     flow = None
@@ -75,24 +117,26 @@ def get_google_service():
             )
         except Exception as e:
             st.error(f"Error reading secrets: {e}")
-            return None
+            return AuthState()
 
     # Strategy B: Fallback to local file (Development)
     # If no secrets are found, we look for a 'client_secret.json' file.
+    # The file is parsed once per modification time (see _client_config_from_file).
     elif os.path.exists('client_secret.json'):
         try:
-            flow = Flow.from_client_secrets_file(
-                'client_secret.json',
+            client_config = _client_config_from_file('client_secret.json', os.path.getmtime('client_secret.json'))
+            flow = Flow.from_client_config(
+                client_config,
                 scopes=SCOPES,
                 redirect_uri=REDIRECT_URI
             )
         except Exception as e:
             st.error(f"Error loading file: {e}")
-            return None
+            return AuthState()
     
     if not flow:
         st.error("⚠️ No configuration found. Please check secrets or client_secret.json.")
-        return None
+        return AuthState()
 
     # 3. Handle the Callback (User returns from Google)
     # We check if the URL contains an authorization 'code'.
@@ -115,8 +159,8 @@ def get_google_service():
             if st.button("🔄 Try again"):
                 st.query_params.clear()
                 st.rerun()
-            return None
+            return AuthState()
     else:
         # If not logged in and no code is present, generate the Google Login URL
         auth_url, _ = flow.authorization_url(prompt='consent')
-        return auth_url
+        return AuthState(url=auth_url)
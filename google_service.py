@@ -1,12 +1,72 @@
 from datetime import datetime, timedelta
 
-def fetch_and_map_events(service, all_user_names):
+# Google's batch endpoint accepts at most 50 requests per HTTP call
+BATCH_LIMIT = 50
+
+def _fetch_events_batched(service, cal_ids, time_min, time_max):
+    """
+    Fetches the events of several calendars with Google's batch endpoint: one page request
+    per calendar, but up to 50 of them travel in a single HTTP round-trip.
+    Calendars with more results are queued again with their next page token (pagination).
+
+    Returns:
+        events_by_cal: A dictionary mapping each calendar id to its list of raw events.
+        errors_by_cal: A dictionary mapping calendar ids whose fetch failed to the error.
+    """
+    events_by_cal = {cal_id: [] for cal_id in cal_ids}
+    errors_by_cal = {}
+    pending = [(cal_id, None) for cal_id in cal_ids]  # (calendar id, page token) still to fetch
+
+    while pending:
+        next_pending = []
+        for chunk_start in range(0, len(pending), BATCH_LIMIT):
+            chunk = pending[chunk_start:chunk_start + BATCH_LIMIT]
+
+            # Called once per request in the batch; request_id is the position inside the chunk
+            def on_response(request_id, response, exception, chunk=chunk):
+                cal_id = chunk[int(request_id)][0]
+                if exception is not None:
+                    errors_by_cal[cal_id] = exception
+                    return
+                events_by_cal[cal_id].extend(response.get('items', []))
+                # Check for the next page token to handle caledars with many events 
+                page_token = response.get('nextPageToken')
+                if page_token:
+                    next_pending.append((cal_id, page_token))
+
+            batch = service.new_batch_http_request(callback=on_response)
+            for i, (cal_id, page_token) in enumerate(chunk):
+                # API call: Retrieve events from the current calendar within the time range
+                batch.add(service.events().list(
+                    calendarId=cal_id, 
+                    timeMin=time_min, 
+                    timeMax=time_max,
+                    maxResults=2500,     # Max number of results per page 
+                    singleEvents=True,    # Expand recurring events into individual instances 
+                    orderBy='startTime',    # Recommended for paginated lists
+                    pageToken=page_token     # Token used to fetch the next page of result 
+                ), request_id=str(i))
+            try:
+                batch.execute()
+            except Exception as e:
+                # The whole batch failed (e.g. network error): mark every calendar in it as failed
+                for cal_id, _ in chunk:
+                    errors_by_cal[cal_id] = e
+
+        # Only calendars that are still error-free get their next page fetched
+        pending = [(cal_id, token) for cal_id, token in next_pending if cal_id not in errors_by_cal]
+
+    return events_by_cal, errors_by_cal
+
+def fetch_and_map_events(service, all_user_names, time_min=None, time_max=None):
     """
     Fetches events from ALL calendars associated with the user's Google account.
+    Optionally only the window between time_min and time_max (UTC datetimes) is requested,
+    so Google returns just the slice that is needed instead of the default ~7 months.
     
     Logic:
     1. It retrieves a list of all calendars.
-    2. It iterates through each calendar and fetches events (using Pagination to get ALL events).
+    2. It fetches the events of all calendars in batched API requests (using Pagination to get ALL events).
     3. It attempts to map each event to a specific user.
     
     Returns:
@@ -15,9 +75,9 @@ def fetch_and_map_events(service, all_user_names):
     """
     
     # 1. Define Time Range for API fetch
-    # The range is set to look back 30 days (for context/past busy times) and 6 months ahead (for future planning)
-    start_dt = datetime.utcnow() - timedelta(days=30)
-    end_dt = datetime.utcnow() + timedelta(days=180) # Look 6 months ahead
+    # By default the range is set to look back 30 days (for context/past busy times) and 6 months ahead (for future planning)
+    start_dt = time_min or datetime.utcnow() - timedelta(days=30)
+    end_dt = time_max or datetime.utcnow() + timedelta(days=180) # Look 6 months ahead
 
     # Convert datetimes to the required ISO 8601 format with 'Z' (Zulu/UTC) time zone indicator
     time_min = start_dt.isoformat() + 'Z' 
@@ -29,6 +89,10 @@ def fetch_and_map_events(service, all_user_names):
     debug_calendars_found = []  # List of all calendar summaries processed
     debug_errors = []           # List of API errors encountered 
     total_events_count = 0
+
+    # Normalize every user name once (lower-case, stripped) instead of once per event.
+    # Pairs of (normalized name, original user name used as key in user_busy_map)
+    normalized_names = [(name.lower().strip(), name) for name in all_user_names]
     
     try:
         # API Call: Get a list of all calendars
@@ -38,6 +102,9 @@ def fetch_and_map_events(service, all_user_names):
         # Handle failure to load the initial list of calendars
         return user_busy_map, {"error": f"Could not load calendar list: {e}", "total_events": 0}
 
+    # Fetch the events of all calendars up front, using Google's batch endpoint
+    events_by_calendar, fetch_errors = _fetch_events_batched(service, [cal['id'] for cal in calendars], time_min, time_max)
+
     # Iterate through each calendar found
     for cal in calendars:
         cal_id = cal['id']
@@ -48,40 +115,17 @@ def fetch_and_map_events(service, all_user_names):
         owner_name = None
         cal_summary_clean = cal_summary.lower().strip()
         # Try to match the calendar name/summary against the list of target user names 
-        for name in all_user_names:
-            user_name_clean = name.lower().strip()
+        for user_name_clean, name in normalized_names:
             # Key word matching: Is the user name in the calendar summary, or vice versa?
             if user_name_clean in cal_summary_clean or cal_summary_clean in user_name_clean:
                 owner_name = name
                 break # Stop checking once an owner is found 
         
-        # --- FETCHING EVENTS (With Pagination Loop) ---
-        all_raw_events_for_this_cal = []
-        page_token = None
-        
-        try:
-            while True:
-                # API call: Retrieve events from the current calendar within the time range
-                events_result = service.events().list(
-                    calendarId=cal_id, 
-                    timeMin=time_min, 
-                    timeMax=time_max,
-                    maxResults=2500,     # Max number of results per page 
-                    singleEvents=True,    # Expand recurring events into individual instances 
-                    orderBy='startTime',    # Recommended for paginated lists
-                    pageToken=page_token     # Token used to fetch the next page of result 
-                ).execute()
-                
-                items = events_result.get('items', [])
-                all_raw_events_for_this_cal.extend(items)
-
-                # Check for the next page token to handle caledars with many events 
-                page_token = events_result.get('nextPageToken')
-                if not page_token:
-                    break # Stop if no more pages
-        except Exception as e:
-            debug_errors.append(f"Error reading '{cal_summary}': {str(e)}")
+        # --- EVENTS (already fetched in batches above) ---
+        if cal_id in fetch_errors:
+            debug_errors.append(f"Error reading '{cal_summary}': {str(fetch_errors[cal_id])}")
             continue # Skip to the next calendar if this one fails 
+        all_raw_events_for_this_cal = events_by_calendar[cal_id]
 
         total_events_count += len(all_raw_events_for_this_cal)
         
@@ -122,9 +166,10 @@ def fetch_and_map_events(service, all_user_names):
                     
                     # Scenario 2 (Fallback): If no owner was determined, check event title for a *User Keyword Match*
                     else:
-                        for name in all_user_names:
+                        summary_clean = summary.lower()
+                        for user_name_clean, name in normalized_names:
                             # If a user's name is found in the event title 
-                            if name.strip().lower() in summary.lower():
+                            if user_name_clean in summary_clean:
                                 user_busy_map[name].append({
                                     'summary': summary, 
                                     'start': s_dt, 
@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from datetime import datetime, timedelta, time
@@ -20,7 +21,9 @@ def load_local_events(file_path="events.xlsx"):
         if file_path.endswith('.xlsx') or file_path.endswith('.xls'):
             df = pd.read_excel(file_path)
         else:
-            df = pd.read_csv(file_path)
+            # pyarrow's multithreaded CSV reader (pyarrow is always installed with Streamlit);
+            # strings still end up in pandas' default string dtype
+            df = pd.read_csv(file_path, engine='pyarrow')
         
         # Normalize column names (lowercase, strip whitespace) to avoid case-sensitivity issues
         df.columns = [str(c).lower().strip() for c in df.columns]
@@ -122,6 +125,29 @@ def check_user_availability(event_start, event_end, user_busy_slots):
             return False # Conflict found, user is NOT available
     return True # No conflict found 
 
+def find_free_events(event_starts, event_ends, user_busy_slots):
+    """
+    Vectorized version of check_user_availability for many events at once.
+    event_starts / event_ends: datetime64 arrays (timezone-naive) of the same length.
+    Returns a boolean array: True where the user has NO busy slot overlapping the event.
+    """
+    if not user_busy_slots:
+        return np.ones(len(event_starts), dtype=bool)
+
+    # Busy slots as timezone-naive datetime64 arrays, sorted by start
+    b_start = np.array([busy['start'].replace(tzinfo=None) for busy in user_busy_slots], dtype='datetime64[ns]')
+    b_end = np.array([busy['end'].replace(tzinfo=None) for busy in user_busy_slots], dtype='datetime64[ns]')
+    order = np.argsort(b_start, kind='stable')
+    b_start = b_start[order]
+    # Latest end among all busy slots starting up to this position
+    max_end = np.maximum.accumulate(b_end[order])
+
+    # Slots that start before the event ends are candidates; the event conflicts
+    # if the latest of their ends lies after the event start (same overlap rule as above)
+    n_before = np.searchsorted(b_start, event_ends, side='left')
+    conflict = (n_before > 0) & (max_end[np.maximum(n_before - 1, 0)] > event_starts)
+    return ~conflict
+
 # --- Core recommendation engine (scoring and ranking) ---
 
 def find_best_slots_for_group(events_df, user_busy_map, selected_users, all_user_prefs, min_attendees=1):
@@ -134,49 +160,53 @@ def find_best_slots_for_group(events_df, user_busy_map, selected_users, all_user
     if events_df.empty:
         return pd.DataFrame()
 
-    results = []
     total_group_size = len(selected_users) if selected_users else 1
 
-    for _, event in events_df.iterrows():
-        attendees = []
-        
-        # 1. Availability Check: Who is free?
-        for user in selected_users:
-            busy_slots = user_busy_map.get(user, [])
-            if check_user_availability(event['Start'], event['End'], busy_slots):
-                attendees.append(user) # User is free
+    # 1. Availability Check: Who is free? (one vectorized pass per user over all events)
+    event_starts = pd.to_datetime(events_df['Start']).to_numpy(dtype='datetime64[ns]')
+    event_ends = pd.to_datetime(events_df['End']).to_numpy(dtype='datetime64[ns]')
+    free_by_user = [(user, find_free_events(event_starts, event_ends, user_busy_map.get(user, [])))
+                    for user in selected_users]
+
+    # 2. Interest Analysis: which preference keyword appears in which event?
+    # Every distinct keyword of the group is searched once over all event texts (vectorized);
+    # per event only a lookup in this boolean keyword x event matrix is left.
+    keywords_by_user = {user: [p.strip() for p in all_user_prefs.get(user, "").split(',') if p.strip()]
+                        for user in selected_users}
+    keywords = list(dict.fromkeys(k for user_keywords in keywords_by_user.values() for k in user_keywords))
+    keyword_pos = {k: i for i, k in enumerate(keywords)}
+
+    # Create a searchable text string from the event's metadata 
+    def text_column(col):
+        return events_df[col].map(str) if col in events_df.columns else ''
+    event_text = (text_column('Category') + " " + text_column('Description') + " " + events_df['Title'].map(str)).str.lower()
+    keyword_hits = np.zeros((len(keywords), len(events_df)), dtype=bool)
+    for i, keyword in enumerate(keywords):
+        # Direct keyword match (e.g., "Sport" in event text)
+        keyword_hits[i] = event_text.str.contains(keyword.lower(), regex=False).to_numpy(dtype=bool)
+
+    # Does THIS user like the event? True where any of their keywords matched
+    user_keyword_ids = {user: [keyword_pos[k] for k in user_keywords] for user, user_keywords in keywords_by_user.items()}
+    likes_by_user = {user: keyword_hits[ids].any(axis=0) for user, ids in user_keyword_ids.items()}
+
+    # Computed metrics of the events that are kept (positions into events_df, plus one list per new column)
+    kept_positions = []
+    metrics = {'attendees': [], 'attendee_count': [], 'group_prefs_text': [], 'matched_tags': [],
+               'interest_score': [], 'availability_score': []}
+
+    # Only positions are needed per event: all per-event data was precomputed as arrays above,
+    # so no Series has to be built per row (as iterrows() would)
+    for pos in range(len(events_df)):
+        attendees = [user for user, free in free_by_user if free[pos]]
         
         # Only process events where enough people are free
         # Skip the event if it doesn't meet the minimum attendance thershold
         if len(attendees) >= min_attendees:
-            
-            # 2. Interest Analysis (Detail Check PER PERSON)
-            attendee_prefs_list = []
-            matched_tags = set()
-            
-            # Create a searchable text string from the event's metadata 
-            event_text = (str(event.get('Category', '')) + " " + str(event.get('Description', '')) + " " + str(event['Title'])).lower()
-            
+            attendee_prefs_list = [all_user_prefs.get(attendee, "") for attendee in attendees]
             # Counter for happy users
-            happy_user_count = 0
-            
-            for attendee in attendees:
-                u_prefs = all_user_prefs.get(attendee, "")
-                attendee_prefs_list.append(u_prefs)
-                
-                # Check if THIS user likes the event
-                user_likes_event = False
-                # Iterate through user's preference keywords (split by comma)
-                for pref in u_prefs.split(','):
-                    clean_pref = pref.strip()
-                    # Check for direct keyword match (e.g., "Sport" in event text)
-                    if clean_pref and clean_pref.lower() in event_text:
-                        matched_tags.add(clean_pref)
-                        user_likes_event = True
-                        # Optimization: once a match is found for a user, stop checking their other preferences
-                
-                if user_likes_event:
-                    happy_user_count += 1
+            happy_user_count = sum(1 for attendee in attendees if likes_by_user[attendee][pos])
+            # Keywords of the attendees found in this event
+            matched_tags = {keywords[i] for attendee in attendees for i in user_keyword_ids[attendee] if keyword_hits[i, pos]}
 
             # --- SCORE CALCULATION ---
             
@@ -189,22 +219,23 @@ def find_best_slots_for_group(events_df, user_busy_map, selected_users, all_user
             availability_score = len(attendees) / total_group_size if total_group_size > 0 else 0
 
             # Store computed metrics
-            event_entry = event.copy()
-            event_entry['attendees'] = ", ".join(attendees)
-            event_entry['attendee_count'] = len(attendees)
-            event_entry['group_prefs_text'] = " ".join(attendee_prefs_list)
-            event_entry['matched_tags'] = ", ".join(matched_tags) if matched_tags else "General"
+            kept_positions.append(pos)
+            metrics['attendees'].append(", ".join(attendees))
+            metrics['attendee_count'].append(len(attendees))
+            metrics['group_prefs_text'].append(" ".join(attendee_prefs_list))
+            metrics['matched_tags'].append(", ".join(matched_tags) if matched_tags else "General")
             
             # Save the separated scores
-            event_entry['interest_score'] = interest_score
-            event_entry['availability_score'] = availability_score
-            
-            results.append(event_entry)
+            metrics['interest_score'].append(interest_score)
+            metrics['availability_score'].append(availability_score)
 
-    if not results:
+    if not kept_positions:
         return pd.DataFrame()
 
-    result_df = pd.DataFrame(results)
+    # The kept events (with their original index and dtypes) plus the computed columns
+    result_df = events_df.iloc[kept_positions].copy()
+    for column, values in metrics.items():
+        result_df[column] = values
 
     # 3. Machine Learning Score (TF-IDF) as Fallback
     # We use TF-IDF to find matches even if exact keywords are missing,
@@ -226,16 +257,18 @@ def find_best_slots_for_group(events_df, user_busy_map, selected_users, all_user
             tfidf_matrix = tfidf.fit_transform(result_df['event_features'])
             
             ml_scores = []
-            for idx, row in result_df.iterrows():
+            # The matrix rows follow the row order of result_df, so they are addressed by position
+            # (not by index label: the index still holds the labels of the original events)
+            for pos, (interest_score, group_prefs_text) in enumerate(zip(result_df['interest_score'], result_df['group_prefs_text'])):
                 # If we already have a manual hit (>0), trust it.
-                if row['interest_score'] > 0:
-                    ml_scores.append(row['interest_score'])
+                if interest_score > 0:
+                    ml_scores.append(interest_score)
                 # If no manual match, use the semantic similarity score from TF-IDF
                 else:
                     # Transform the group's combined preferences into a vector 
-                    user_vector = tfidf.transform([row['group_prefs_text']])
+                    user_vector = tfidf.transform([group_prefs_text])
                     # Cosine similarity measures the angular distance (similarity) between the user vector and the event vector 
-                    sim = cosine_similarity(user_vector, tfidf_matrix[idx])
+                    sim = cosine_similarity(user_vector, tfidf_matrix[pos])
                     ml_scores.append(sim[0][0])
             
             result_df['final_interest_score'] = ml_scores
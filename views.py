@@ -1,14 +1,141 @@
 import streamlit as st
-import pandas as pd
+import os
 from datetime import datetime, timedelta
-from streamlit_calendar import calendar
+from itertools import cycle
 
 # Import your modules
+# (pandas/numpy, auth, google_service, recommender, visualization and streamlit_calendar pull in
+# the Google API client, scikit-learn, matplotlib/seaborn and a JS component; they are imported
+# inside the functions that need them, so the Start and Profiles pages don't pay for them.)
 import database
-import auth
-import google_service
-import recommender
-import visualization
+
+# Interests a user can pick in their profile (matched against event category/description/title)
+INTEREST_OPTIONS = ["Sport", "Culture", "Party", "Food", "Music", "Outdoor"]
+
+# --- CACHED DATA ACCESS ---
+# Streamlit reruns the whole script on every widget interaction. These helpers keep
+# the results of expensive calls in memory so reruns don't hit SQLite again.
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_users():
+    """
+    Returns all (name, preferences) rows from the database, memoized across reruns.
+    Cleared whenever a profile is saved so new users show up immediately.
+    """
+    return database.get_all_users()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_user_names():
+    """
+    Returns only the user names, derived once from the cached user list.
+    """
+    return [u[0] for u in _cached_users()]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_user_prefs():
+    """
+    Returns a dict mapping each user name to their preference string.
+    """
+    return {u[0]: u[1] for u in _cached_users()}
+
+def _clear_user_cache():
+    """
+    Invalidates all cached user data (call after any write to the users table).
+    """
+    _cached_users.clear()
+    _cached_user_names.clear()
+    _cached_user_prefs.clear()
+
+@st.cache_data(show_spinner=False)
+def _cached_saved_events():
+    """
+    Returns the saved group activities (already formatted for the calendar), memoized across reruns.
+    Cleared whenever an activity is saved or all activities are deleted.
+    """
+    return database.get_saved_events()
+
+@st.cache_data(ttl=300, show_spinner="Fetching calendars...")
+def _fetch_events(_service, names, account_key, window=None, refresh=0):
+    """
+    Fetches Google Calendar events mapped to users, memoized per user set and account.
+    The leading underscore tells Streamlit not to hash the (unhashable) service object;
+    'account_key' keeps cached calendars of different Google logins apart.
+    'window' is an optional (time_min, time_max) pair limiting the fetch to that range.
+    'refresh' is the session's refresh counter (see _refresh_count); bumping it forces a new fetch.
+    """
+    import google_service
+    time_min, time_max = window or (None, None)
+    return google_service.fetch_and_map_events(_service, list(names), time_min, time_max)
+
+def _refresh_count():
+    """
+    Returns this session's calendar refresh counter, bumping it when the refresh button is clicked.
+    Passed to _fetch_events, so a refresh only re-fetches the calendars of the session that
+    clicked, instead of clearing the cached calendars of every session on the server.
+    """
+    st.session_state.setdefault("calendar_refresh", 0)
+    if st.button("🔄 Refresh calendar"):
+        st.session_state.calendar_refresh += 1
+    return st.session_state.calendar_refresh
+
+def _google_account_key():
+    """
+    Returns a non-secret fingerprint of the current Google credentials (used as cache key).
+    """
+    import auth
+    return auth.credentials_key(st.session_state.get("credentials"))
+
+@st.cache_data(show_spinner=False)
+def _load_events(path, mtime, day):
+    """
+    Loads the local event catalog, memoized per file and modification time.
+    'day' is part of the key because weekly events are expanded relative to today.
+    """
+    import recommender
+    return recommender.load_local_events(path)
+
+def _load_event_catalog():
+    """
+    Returns the events from 'events.csv', falling back to 'events.xlsx'.
+    A file is only re-parsed when it changes on disk (or on a new day).
+    The chosen catalog is also kept in session_state, so repeated searches in the same
+    session reuse it directly instead of copying it out of the data cache again.
+    Treat the returned DataFrame as read-only.
+    """
+    import pandas as pd
+    today = datetime.now().date()
+    sources = tuple((path, os.path.getmtime(path)) for path in ("events.csv", "events.xlsx") if os.path.exists(path))
+    key = (sources, today)
+
+    cached = st.session_state.get('events_catalog')
+    if cached is None or cached[0] != key:
+        events_df = pd.DataFrame()
+        for path, mtime in sources:
+            events_df = _load_events(path, mtime, today)
+            if not events_df.empty:
+                # Parse the start/end times once here, not on every search, and sort by start
+                # so a week can be cut out with a binary search (see show_activity_planner)
+                events_df['Start'] = pd.to_datetime(events_df['Start'])
+                events_df['End'] = pd.to_datetime(events_df['End'])
+                events_df = events_df.sort_values('Start', kind='stable')
+                break
+        cached = (key, events_df)
+        st.session_state.events_catalog = cached
+    return cached[1]
+
+def _planner_window():
+    """
+    Returns the (time_min, time_max) range covered by the event catalog, or None if it is empty.
+    The planner only needs busy slots within this range, so only that slice is fetched from Google.
+    Padded by a day on both sides, since catalog times are local and the API expects UTC.
+    """
+    import pandas as pd
+    events_df = _load_event_catalog()
+    if events_df.empty:
+        return None
+    first_start = events_df['Start'].min().floor('D') - pd.Timedelta(days=1)
+    last_end = events_df['End'].max().ceil('D') + pd.Timedelta(days=1)
+    return (first_start.to_pydatetime(), last_end.to_pydatetime())
 
 def show_start_page():
     """
@@ -31,9 +158,11 @@ def show_start_page():
     with col2:
         st.info("Select 'Profiles' in the menu on the left to get started!")
 
+@st.fragment
 def show_profiles_page():
     """
     Renders the Profile setup page where users can register and set or update preferences.
+    Runs as a fragment: interacting with the page only reruns this function, not the whole app.
     """
     st.title("👤 User Profile & Setup")
     st.write("Create profiles for you and your friends here.")
@@ -43,16 +172,9 @@ def show_profiles_page():
         name = st.text_input("Your Name *")
         email = st.text_input("Email (serves as ID) *")
         
-        st.write("Your Interests:")
-        # Use columns for a compact display of interest checkboxes 
-        c1, c2, c3 = st.columns(3)
-        prefs = []
-        if c1.checkbox("Sport"): prefs.append("Sport")
-        if c2.checkbox("Culture"): prefs.append("Culture")
-        if c3.checkbox("Party"): prefs.append("Party")
-        if c1.checkbox("Food"): prefs.append("Food")
-        if c2.checkbox("Music"): prefs.append("Music")
-        if c3.checkbox("Outdoor"): prefs.append("Outdoor")
+        # A single multiselect instead of one checkbox per interest (one widget, one state diff).
+        # The selected labels are stored as-is, they match the event categories.
+        prefs = st.multiselect("Your Interests:", INTEREST_OPTIONS)
         
         submitted = st.form_submit_button("Save Profile")
         
@@ -66,6 +188,8 @@ def show_profiles_page():
                 # Call the database module to save or update user data 
                 success, operation = database.add_user(name, email, prefs)
                 if success:
+                    # Drop the cached user list so the new/updated profile is visible right away
+                    _clear_user_cache()
                     if operation == "updated":
                         st.success(f"Profile for {name} updated!")
                     else:
@@ -76,87 +200,262 @@ def show_profiles_page():
     st.divider()
     st.subheader("Current Users in Database")
     # Fetch and display all current users for transparency 
-    users = database.get_all_users()
+    users = _cached_users()
     if not users:
         st.warning("No users created yet.")
     else:
         for u in users:
             st.text(f"• {u[0]} (Interests: {u[1]})")
 
-def render_card_content(row, time_str, location, interest_score, avail_score, missing_people, idx, save_callback, color, is_expander=False):
+def _add_display_columns(ranked_df, selected):
+    """
+    Precomputes the values the result cards need as vectorized columns.
+    Runs once per search, instead of once per card on every rerun.
+    """
+    import numpy as np
+    import pandas as pd
+    starts = pd.to_datetime(ranked_df['Start'])
+    ends = pd.to_datetime(ranked_df['End'])
+    # ISO format for compatability with the calendar / database
+    ranked_df['start_iso'] = starts.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    ranked_df['end_iso'] = ends.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    # Time nicely formatted for the card (e.g., "Monday, 14:00 - 16:00")
+    ranked_df['time_str'] = starts.dt.strftime('%A, %H:%M') + " - " + ends.dt.strftime('%H:%M')
+    # Scores as whole percentages for display (truncated like int())
+    ranked_df['interest_percent'] = (ranked_df['final_interest_score'].fillna(0) * 100).astype('int16')
+    ranked_df['avail_percent'] = (ranked_df['availability_score'].fillna(0) * 100).astype('int16')
+    # Selected people who are NOT free, as display text for the warning ('' if everyone can come)
+    attending_sets = [set(a.split(', ')) for a in ranked_df['attendees']]
+    ranked_df['missing_people'] = [", ".join(p for p in selected if p not in s) for s in attending_sets]
+    # Recommendation quality bucket (decides how the card is rendered), classified in one pass.
+    # Order of the conditions matters: the first match wins.
+    avail_perfect = ranked_df['availability_score'] >= 0.99
+    interest_perfect = ranked_df['final_interest_score'] >= 0.99
+    interest_high = ranked_df['final_interest_score'] > 0.6
+    # Stored as categorical: one int8 code per row, read back as the bucket name
+    ranked_df['bucket'] = pd.Categorical(
+        np.select(
+            [avail_perfect & interest_perfect, avail_perfect, interest_high],
+            ["jackpot", "timing", "interest"],
+            default="normal"
+        ),
+        categories=["jackpot", "timing", "interest", "normal"]
+    )
+    return ranked_df
+
+# Column width ratios of the result card (time/location, interests, scores)
+# and of the centered "Show more" row, shared by every card instead of rebuilt per call
+CARD_COLUMN_RATIOS = (1, 2, 1.5)
+CENTERED_COLUMN_RATIOS = (1, 2, 1)
+
+# How each recommendation quality bucket (see _add_display_columns) is rendered:
+# heading icon and label, the notice below it (st function name, text) and the calendar color.
+# Buckets without a notice are shown collapsed in an expander instead of a bordered card.
+CARD_STYLES = {
+    # 1. THE JACKPOT (Gold) Perfect availability AND perfect interest match 
+    "jackpot": {"icon": "🏆", "label": "PERFECT MATCH", "color": "#FFD700",
+                "notice": ("info", "Everyone is free AND it matches everyone's interests perfectly!")},
+    # 2. TIME PERFECT (Green) - perfect availability 
+    "timing": {"icon": "✅", "label": "GOOD TIMING", "color": "#28a745",
+               "notice": ("success", " Everyone is free at this time.")},
+    # 3. INTEREST PERFECT (Blue) - High interest match, but some people are busy
+    "interest": {"icon": "💙", "label": "HIGH INTEREST", "color": "#1E90FF",
+                 "notice": ("warning", " Only {attending}/{group} people are free, but they will love it!")},
+    # 4. NORMAL (Grey) - Everything else 
+    "normal": {"icon": None, "label": None, "color": "#6c757d", "notice": None},
+}
+
+# Columns the result cards actually read; everything else the recommender produces
+# (TF-IDF text, intermediate scores) is dropped before the results go into session_state
+CARD_COLUMNS = [
+    "Title", "Start", "End", "Category", "Description", "location",
+    "attendees", "attendee_count", "matched_tags", "final_interest_score", "availability_score",
+    "start_iso", "end_iso", "time_str", "interest_percent", "avail_percent", "bucket", "missing_people",
+]
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _rank_events(events_df, user_busy_map, selected, user_prefs, min_attendees=1):
+    """
+    Runs the recommender and adds the display columns, memoized on all of its inputs.
+    Switching back to a previously searched group or week reuses the ranking
+    (including the TF-IDF step) instead of recomputing it.
+    """
+    import pandas as pd
+    import recommender
+    ranked_df = recommender.find_best_slots_for_group(events_df, user_busy_map, selected, user_prefs, min_attendees=min_attendees)
+    if not ranked_df.empty:
+        ranked_df = _add_display_columns(ranked_df, selected)
+        ranked_df = ranked_df[[c for c in CARD_COLUMNS if c in ranked_df.columns]]
+        # Compact dtypes for what stays in session_state: few distinct categories/tags, small counts
+        ranked_df = ranked_df.astype({'Category': 'category', 'matched_tags': 'category'})
+        ranked_df['attendee_count'] = pd.to_numeric(ranked_df['attendee_count'], downcast='integer')
+    return ranked_df
+
+def render_card_content(row, location, interest_score, save_callback, color, is_expander=False):
     """
     Helper function to render the detailed content for a single recommended event card.
-    
+    'row' is a namedtuple from DataFrame.itertuples(), so columns (including the precomputed
+    display columns) are read as attributes; the other arguments are passed to the save callback.
     """
     # Use columns to align content neatly 
-    c1, c2, c3 = st.columns([1, 2, 1.5])
+    c1, c2, c3 = st.columns(CARD_COLUMN_RATIOS)
     
+    # Lines in normal text size are sent as ONE markdown element (paragraphs separated by
+    # blank lines) instead of one element per line, so a card costs fewer frontend messages.
     # Column 1: Time & Location & Catergory 
-    c1.write(f" **{time_str}**")
-    c1.write(f"📍 **{location}**") 
-    c1.caption(f"Category: {row['Category']}")
+    c1.markdown(f"**{row.time_str}**\n\n📍 **{location}**")
+    c1.caption(f"Category: {row.Category}")
     
     # Column 2: Interests and Missing People 
-    c2.write(f"**Interests Matched:** {row['matched_tags']}")
-    if missing_people:
-        c2.caption(f"❌ Missing: {', '.join(missing_people)}")
+    c2.markdown(f"**Interests Matched:** {row.matched_tags}")
+    if row.missing_people:
+        c2.caption(f"❌ Missing: {row.missing_people}")
     
-    # Column 3: The Scores (Side-by-Side)
+    # Column 3: The Scores (Side-by-Side), displayed as percentages
     sc1, sc2 = c3.columns(2)
-    with sc1:
-        st.write(f" **Interest**")
-        # Display score as the percentage 
-        st.write(f"**{int(interest_score*100)}%**")
-    with sc2:
-        st.write(f" **Availability**")
-        st.write(f"**{int(avail_score*100)}%**")
+    sc1.markdown(f"**Interest**\n\n**{row.interest_percent}%**")
+    sc2.markdown(f"**Availability**\n\n**{row.avail_percent}%**")
     
     # Extra explanation text for the 'Normal' (Grey) category 
     if is_expander:
         st.write("**Why this option?**")
-        if row['attendee_count'] > 1:
-            st.info(f"It works for {row['attendee_count']} people.")
-        elif row['matched_tags'] != "General":
-            st.info(f"It matches interest: '{row['matched_tags']}'")
+        if row.attendee_count > 1:
+            st.info(f"It works for {row.attendee_count} people.")
+        elif row.matched_tags != "General":
+            st.info(f"It matches interest: '{row.matched_tags}'")
         else:
             st.write("It's an available option to consider.")
         # Display the event description if present 
-        if row['Description']:
-            st.write(f"_{row['Description']}_")
+        if row.Description:
+            st.write(f"_{row.Description}_")
 
     # The "Add to Calendar" button, keyed uniquely by event index 
-    if st.button(f"Add '{row['Title']}' to Calendar", key=f"btn_{idx}"):
-        save_callback(row, color, interest_score, location)
+    # (the save runs as on_click callback, before the rerun that the click triggers)
+    st.button(f"Add '{row.Title}' to Calendar", key=f"btn_{row.Index}",
+              on_click=save_callback, args=(row, color, interest_score, location))
         
+def render_suggestion(row, total_group_size, save_callback):
+    """
+    Renders one recommended event, styled by its quality bucket (see CARD_STYLES).
+    'row' is a namedtuple from DataFrame.itertuples() with the precomputed display columns.
+    """
+    style = CARD_STYLES[row.bucket]
+    location = getattr(row, 'location', None) # Use location from the dataframe (if the source has one)
+    content_args = (row, location, row.final_interest_score, save_callback, style["color"])
+
+    if style["notice"] is None:
+        # Lower-ranked options are collapsed, with an explanation why they are still an option
+        with st.expander(f"{row.Title} ({row.attendee_count}/{total_group_size} Ppl)"):
+            render_card_content(*content_args, is_expander=True)
+        return
+
+    notice_kind, notice_text = style["notice"]
+    with st.container(border=True):
+        st.markdown(f"### {style['icon']} **{style['label']}: {row.Title}**")
+        getattr(st, notice_kind)(notice_text.format(attending=row.attendee_count, group=total_group_size))
+        render_card_content(*content_args)
+
+@st.fragment
+def _show_results(total_group_size):
+    """
+    Renders the ranked event suggestions from session_state as cards (with pagination).
+    Runs as its own fragment: 'Add to Calendar', 'Show more' and 'Clear Results' only rerun
+    this list, not the calendar connection or the planning form above it.
+    """
+    ranked_df = st.session_state.ranked_results
+    if ranked_df is None:
+        return
+
+    if not ranked_df.empty:
+        st.subheader("🎯 Event Suggestions")
+        # Button to clear the current results 
+        # (state is changed in on_click callbacks, which run before the rerun of this
+        # fragment, so no extra st.rerun() is needed to show the new state)
+        def clear_results():
+            st.session_state.ranked_results = None
+
+        st.button("Clear Results", on_click=clear_results)
+
+        st.markdown("---")
+
+        # Apply the current result limit (for pagination)
+        current_limit = st.session_state.results_limit
+        visible_df = ranked_df.head(current_limit)
+
+        # Define the Callback Function that saves the chosen event to the database
+        # (defined once, outside the loop, since it is the same for every card)
+        def save_to_db_callback(r, col, score, loc):
+            saved = database.add_saved_event(
+                f"{r.Title}",
+                r.start_iso, # ISO format for compatability (precomputed)
+                r.end_iso,
+                col, # color associated with the result category 
+                r.Category,
+                r.attendees,
+                float(score),
+                loc
+            )
+            if saved:
+                _cached_saved_events.clear()
+                st.toast(f"Saved '{r.Title}' permanently to Calendar!")
+            else:
+                st.toast(f"'{r.Title}' is already saved.")
+
+        # Iterate through results the top N results and render cards 
+        # itertuples() yields lightweight namedtuples instead of building a Series per row
+        for row in visible_df.itertuples(name="Suggestion"):
+            render_suggestion(row, total_group_size, save_to_db_callback)
+
+        # Check whether there are more results than currently displayed
+        if len(ranked_df) > current_limit:
+            col_b1, col_b2, col_b3 = st.columns(CENTERED_COLUMN_RATIOS)
+            with col_b2:
+                # 'Show more' button if there are more results 
+                def show_more():
+                    st.session_state.results_limit += 10 # increase limit by 10
+
+                st.button("Show more events", type="primary", use_container_width=True, on_click=show_more)
+
+    else:
+        st.warning("No suitable events found.")
+
+@st.fragment
 def show_activity_planner():
     """
     Renders the main planning interface.
     Here users connect their calendar, select participants, set the date range and view recommandations.
+    Runs as a fragment (see show_profiles_page); st.rerun() calls inside still rerun the full app.
     """
+    import numpy as np
+    import auth
+
     st.title("Smart Group Planner")
     # Initialize session state for limiting results 
     if 'results_limit' not in st.session_state:
         st.session_state.results_limit = 10
     
+    # All user names, read once and reused for the calendar fetch and the participant selection
+    all_user_names = _cached_user_names()
+    
     # 1. Authentication Check & Connection
-    auth_result = auth.get_google_service()
+    auth_state = auth.get_google_service()
     user_busy_map = {}  # Dictionnary to store fetched events mapped to users 
     
-    if isinstance(auth_result, str):
-        # Authentication not complete (auth-result is the URL to connect)
+    if auth_state.url:
+        # Authentication not complete (auth_state.url is the URL to connect)
         st.warning("Not connected.")
-        st.link_button("Connect with Google Calendar", auth_result)
-    elif auth_result:
-        # Authentification successful (auth-result is the service objects)
-        service = auth_result
+        st.link_button("Connect with Google Calendar", auth_state.url)
+    elif auth_state.service is not None:
+        # Authentification successful (auth_state.service is the service object)
+        service = auth_state.service
         st.success("✅ Connected!")
-        
-        all_users_db = database.get_all_users()
-        all_user_names = [u[0] for u in all_users_db]
+        # Calendar data is cached for a few minutes; allow forcing a fresh pull from Google
+        refresh = _refresh_count()
         
         # 2. Fetch Calendar Data
-        # This calls the Google API to get all selected users events 
-        user_busy_map, stats = google_service.fetch_and_map_events(service, all_user_names)
+        # This calls the Google API to get all selected users events (cached across reruns),
+        # limited to the date range of the event catalog
+        user_busy_map, stats = _fetch_events(service, tuple(all_user_names), _google_account_key(), _planner_window(), refresh)
         
         # Diagnostic box to help users debug why events might be missing
         with st.expander(" Diagnostic: Google Calendar Events", expanded=False):
@@ -167,206 +466,143 @@ def show_activity_planner():
     st.divider()
 
     # 3. Planning Setup (Participants & Date Range)
-    all_users_data = database.get_all_users()
-    if not all_users_data:
+    if not all_user_names:
         st.warning("Please create profiles first.")
     else:
         today = datetime.now().date()
         
-        # Layout: User selection on left, Week selection on right
-        col1, col2 = st.columns(2)
-        with col1:
-            user_names = [u[0] for u in all_users_data]
-            # Multi-select for choosing who is part of the planning group 
-            selected = st.multiselect("Who is planning?", user_names, default=user_names)
-        
-        with col2:
-            # Date input to select the target week
-            selected_date = st.date_input("Plan for which week?", value=today)
-            # Calculate the Monday and Sunday of the selected week 
-            start_of_week = selected_date - timedelta(days=selected_date.weekday())
-            end_of_week = start_of_week + timedelta(days=6)
-            st.caption(f"Showing events for: **{start_of_week.strftime('%d.%m.%Y')} - {end_of_week.strftime('%d.%m.%Y')}**")
-        # Match user names to their interest preferences 
-        user_prefs_dict = {u[0]: u[1] for u in all_users_data}
-
         # 4. Run Analysis Trigger 
-        if st.button("Search Events") and selected:
-            # Reset the display limit to 10 on a new search 
-            st.session_state.results_limit = 10
-            
-            # Load local events database 
-            events_df = recommender.load_local_events("events.csv") 
-            # Fallback to load from (Excel file) XLSX if CVS fails 
-            if events_df.empty:
-                 events_df = recommender.load_local_events("events.xlsx")
-            
-            # Filter events to match the users selected week 
-            if not events_df.empty:
-                events_df['Start'] = pd.to_datetime(events_df['Start'])
-                mask = (events_df['Start'].dt.date >= start_of_week) & (events_df['Start'].dt.date <= end_of_week)
-                events_df_filtered = events_df.loc[mask].copy()
-            else:
-                events_df_filtered = events_df
-
-            # Call the Recommender Engine to score potential events 
-            st.session_state.ranked_results = recommender.find_best_slots_for_group(
-                events_df_filtered, 
-                user_busy_map, 
-                selected, 
-                user_prefs_dict,
-                min_attendees=1 
-            )
+        # The 'searching' flag locks the button while the analysis runs, so a double-click
+        # can't start the recommender twice. It is set in the click callback (which runs
+        # before the rerun renders the button), so the button already shows up disabled.
+        if 'searching' not in st.session_state:
+            st.session_state.searching = False
 
-        # 5. Display Results
-        if st.session_state.ranked_results is not None:
-            ranked_df = st.session_state.ranked_results
+        def start_search():
+            st.session_state.searching = True
+
+        # The week picker stays outside the form, so the caption below it follows the picked date
+        # Date input to select the target week
+        selected_date = st.date_input("Plan for which week?", value=today)
+        # Calculate the Monday and Sunday of the selected week 
+        start_of_week = selected_date - timedelta(days=selected_date.weekday())
+        end_of_week = start_of_week + timedelta(days=6)
+        st.caption(f"Showing events for: **{start_of_week.strftime('%d.%m.%Y')} - {end_of_week.strftime('%d.%m.%Y')}**")
+
+        # The other planning inputs live in a form: changing participants or minimum
+        # attendees does not rerun the page, they are submitted once with the button
+        with st.form("planner_form"):
+            # Layout: User selection on left, minimum attendees on right
+            col1, col2 = st.columns(2)
+            with col1:
+                # Multi-select for choosing who is part of the planning group 
+                selected = st.multiselect("Who is planning?", all_user_names, default=all_user_names)
             
-            if not ranked_df.empty:
-                st.subheader("🎯 Event Suggestions")
-                # Button to clear the current results 
-                if st.button("Clear Results"):
-                    st.session_state.ranked_results = None
-                    st.rerun()
-                
-                st.markdown("---")
-                
-                total_group_size = len(selected)
-
-                # Apply the current result limit (for pagination)
-                current_limit = st.session_state.results_limit
-                visible_df = ranked_df.head(current_limit)
-
-               # Iterate through results the top N results and render cards 
-                for idx, row in visible_df.iterrows():
-                    # Extract necessary scoring and location data 
-                    interest_score = row.get('final_interest_score', 0)
-                    avail_score = row.get('availability_score', 0)
-                    location = row.get('location') # Use location from the dataframe 
-
-                    # Determine categories for visual grouping/priority 
-                    is_avail_perfect = (avail_score >= 0.99)
-                    is_interest_high = (interest_score > 0.6)
-                    is_interest_perfect = (interest_score >= 0.99)
-                    
-                    # Format time nicely (e.g., "Mon 14:00 - 16:00")
-                    time_str = f"{row['Start'].strftime('%A, %H:%M')} - {row['End'].strftime('%H:%M')}"
-
-                    # Calculate missing people for the warning text 
-                    attending_count = row['attendee_count']
-                    missing_people = []
-                    if not is_avail_perfect:
-                        # assumes 'attendees' is a comma-separated string
-                        attending_list = [x.strip() for x in row['attendees'].split(',')]
-                        # Find who was selected but is not in the attendee list 
-                        missing_people = [p for p in selected if p not in attending_list]
-
-                    # Define the Callback Function that saves the chosen event to the database 
-                    def save_to_db_callback(r, col, score, loc):
-                        saved = database.add_saved_event(
-                            f"{r['Title']}",
-                            r['Start'].strftime("%Y-%m-%dT%H:%M:%S"), # ISO format for compatability 
-                            r['End'].strftime("%Y-%m-%dT%H:%M:%S"),
-                            col, # color associated with the result category 
-                            r['Category'],
-                            r['attendees'],
-                            float(score),
-                            loc
-                        )
-                        if saved:
-                            st.toast(f"Saved '{r['Title']}' permanently to Calendar!")
-                        else:
-                            st.toast(f"'{r['Title']}' is already saved.")
+            with col2:
+                # Events where fewer people are free are skipped by the recommender
+                min_attendees = st.number_input("Minimum attendees", min_value=1, max_value=len(all_user_names), value=1, step=1)
 
-                    # --- Rendering based on Recommendation Quality (Gold, Green, Blue, Grey) ---
-                    
-                    # 1. THE JACKPOT (Gold) Perfect availability AND perfect interest match 
-                    if is_avail_perfect and is_interest_perfect:
-                        with st.container(border=True):
-                            st.markdown(f"### 🏆 **PERFECT MATCH: {row['Title']}**")
-                            st.info("Everyone is free AND it matches everyone's interests perfectly!")
-                            render_card_content(row, time_str, location, interest_score, avail_score, missing_people, idx, save_to_db_callback, "#FFD700")
-                    
-                    # 2. TIME PERFECT (Green) - perfect availability 
-                    elif is_avail_perfect:
-                        with st.container(border=True):
-                            st.markdown(f"### ✅ **GOOD TIMING: {row['Title']}**")
-                            st.success(" Everyone is free at this time.")
-                            render_card_content(row, time_str, location, interest_score, avail_score, missing_people, idx, save_to_db_callback, "#28a745")
-
-                    # 3. INTEREST PERFECT (Blue) - High interest match, but some people are busy
-                    elif is_interest_high:
-                        with st.container(border=True):
-                            st.markdown(f"### 💙 **HIGH INTEREST: {row['Title']}**")
-                            st.warning(f" Only {attending_count}/{total_group_size} people are free, but they will love it!")
-                            render_card_content(row, time_str, location, interest_score, avail_score, missing_people, idx, save_to_db_callback, "#1E90FF")
-
-                    # 4. NORMAL (Grey) - Everything else 
+            st.form_submit_button("Search Events", on_click=start_search, disabled=st.session_state.searching)
+
+        # Match user names to their interest preferences 
+        user_prefs_dict = _cached_user_prefs()
+
+        if st.session_state.searching:
+            try:
+                if selected:
+                    # Reset the display limit to 10 on a new search 
+                    st.session_state.results_limit = 10
+            
+                    # Load local events database (CSV first, XLSX as fallback; cached until the file changes)
+                    # Note: this DataFrame is shared across searches, so it is only read here, never modified
+                    events_df = _load_event_catalog()
+            
+                    # Filter events to match the users selected week 
+                    # (the catalog is sorted by start, so the week is one contiguous slice)
+                    if not events_df.empty:
+                        week_bounds = [np.datetime64(start_of_week), np.datetime64(end_of_week + timedelta(days=1))]
+                        first, last = events_df['Start'].to_numpy().searchsorted(week_bounds)
+                        events_df_filtered = events_df.iloc[first:last].copy()
                     else:
-                        with st.expander(f"{row['Title']} ({attending_count}/{total_group_size} Ppl)"):
-                            render_card_content(row, time_str, location, interest_score, avail_score, missing_people, idx, save_to_db_callback, "#6c757d", is_expander=True)
-                
+                        events_df_filtered = events_df
 
-                # Check whether there are more results than currently displayed
-                if len(ranked_df) > current_limit:
-                    col_b1, col_b2, col_b3 = st.columns([1, 2, 1])
-                    with col_b2:
-                        # 'Show more' button if there are more results 
-                        if st.button("Show more events", type="primary", use_container_width=True):
-                            st.session_state.results_limit += 10 # increase limit by 10
-                            st.rerun() # Return the script to display the new results
+                    # Call the Recommender Engine to score potential events 
+                    # (memoized: repeating a search for a previously seen group/week is instant)
+                    st.session_state.ranked_results = _rank_events(
+                        events_df_filtered, 
+                        user_busy_map, 
+                        selected, 
+                        user_prefs_dict,
+                        min_attendees=int(min_attendees)
+                    )
+            finally:
+                st.session_state.searching = False
+            # Rerun once so the button is rendered enabled again
+            st.rerun()
 
-            else:
-                st.warning("No suitable events found.")
+        # 5. Display Results
+        _show_results(len(selected))
 
+@st.fragment
 def show_group_calendar():
     """
     Renders the visual calendar using streamlit-calender, it combines:
     Private Google Calender events (for busy slots)
     Saved group activities from the Meetly database (the planned events)
     Triggers visualization module to show usage statistics.
+    Runs as a fragment (see show_profiles_page).
     """
+    from streamlit_calendar import calendar
+    import auth
+    import visualization
+
     st.title("Group Calendar Overview")
     # Check for authentication again 
-    auth_result = auth.get_google_service()
-    if auth_result and not isinstance(auth_result, str):
-        service = auth_result
-        all_users_db = database.get_all_users()
-        all_user_names = [u[0] for u in all_users_db]
-
-        # Fetch private events from Google Calender 
-        user_busy_map, stats = google_service.fetch_and_map_events(service, all_user_names)
+    auth_state = auth.get_google_service()
+    if auth_state.service is not None:
+        service = auth_state.service
+        all_user_names = _cached_user_names()
+
+        # Calendar data is cached for a few minutes; allow forcing a fresh pull from Google
+        refresh = _refresh_count()
+
+        # Fetch private events from Google Calender (cached across reruns)
+        user_busy_map, stats = _fetch_events(service, tuple(all_user_names), _google_account_key(), refresh=refresh)
         
-        cal_events = [] # List for full calender (streamlit-calender) events 
-        visualization_data = [] # List for data required by the visualization module 
         # define a rotating colors for different user's private events 
         colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#FFA07A", "#98D8C8"]
+        # Assign each user their color once, so the event loop only does a dict lookup
+        user_color = dict(zip(user_busy_map, cycle(colors)))
         
         # 1. Add Private Google Events
-        for i, (user_name, events) in enumerate(user_busy_map.items()):
-            color = colors[i % len(colors)]
-            for event in events:
-                # Format event for full calender/ streamlit-calender 
-                cal_events.append({
-                    "title": f"{user_name}: {event.get('summary', 'Termin')}",
-                    "start": event['start'].isoformat(),
-                    "end": event['end'].isoformat(),
-                    "backgroundColor": color,
-                    "borderColor": color,
-                    # extended properties are used for the click handler 
-                    "extendedProps": {"category": "Private", "attendees": user_name, "type": "google"}
-                })
-                
-                # Collects data for the statistics visualizations
-                visualization_data.append({
-                    "summary": event.get('summary', 'Termin'),
-                    "start": event['start'],
-                    "end": event['end'],
-                    "person": user_name 
-                })
+        # Both lists are built as flat list comprehensions over all (user, event) pairs.
+        # Events formatted for full calender/ streamlit-calender 
+        cal_events = [
+            {
+                "title": f"{user_name}: {event.get('summary', 'Termin')}",
+                "start": event['start'].isoformat(),
+                "end": event['end'].isoformat(),
+                "backgroundColor": user_color[user_name],
+                "borderColor": user_color[user_name],
+                # extended properties are used for the click handler 
+                "extendedProps": {"category": "Private", "attendees": user_name, "type": "google"}
+            }
+            for user_name, events in user_busy_map.items() for event in events
+        ]
+        
+        # Collects data for the statistics visualizations
+        visualization_data = [
+            {
+                "summary": event.get('summary', 'Termin'),
+                "start": event['start'],
+                "end": event['end'],
+                "person": user_name 
+            }
+            for user_name, events in user_busy_map.items() for event in events
+        ]
         
         # 2. Add Saved Group Events from Database
-        saved_events = database.get_saved_events()
+        saved_events = _cached_saved_events()
         if saved_events:
             cal_events.extend(saved_events)
             st.success(f"Loaded {len(saved_events)} saved group activities from Database!")
@@ -374,6 +610,7 @@ def show_group_calendar():
             # Option to clear all saved events from the database 
             if st.button("Clear ALL saved activities"):
                 database.clear_saved_events()
+                _cached_saved_events.clear()
                 st.rerun()
 
         if cal_events:
@@ -381,8 +618,20 @@ def show_group_calendar():
             calendar_return = calendar(
                 events=cal_events, 
                 options={"initialView": "dayGridMonth", "height": 700}, # display as month view initially 
-                callbacks=["eventClick"] # Enable event click listener 
+                callbacks=["eventClick"], # Enable event click listener 
+                # A fixed key lets Streamlit reuse the same component instance across reruns,
+                # even when the event list changes, instead of mounting a new calendar
+                key="group_calendar"
             )
+
+            # The fixed key also keeps the component's last click (in the browser too), even
+            # after the clicked event is gone (e.g. saved activities were cleared), so a click
+            # only counts while the event is still on the calendar
+            if calendar_return and "eventClick" in calendar_return:
+                clicked = calendar_return["eventClick"]["event"]
+                if not any(e["title"] == clicked.get("title") and e.get("extendedProps", {}) == clicked.get("extendedProps", {})
+                           for e in cal_events):
+                    calendar_return = {k: v for k, v in calendar_return.items() if k != "eventClick"}
             
             # Handle Clicks (Show event details popup)
             if calendar_return and "eventClick" in calendar_return: